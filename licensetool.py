@@ -28,17 +28,21 @@ optionally with change information.
 
 import sys
 import os
+import re
+import functools
+import csv
 import logging
 import argparse
-import re
-import pandas as pd
-from openpyxl.utils import get_column_letter
-from openpyxl import load_workbook
+
+# pandas and openpyxl are imported in the functions using them,
+# importing them takes most of the start-up time. This way the help and
+# argument/file error cases return immediately.
+# pylint: disable=import-outside-toplevel
 
 # Lots of literals
 _CSV = ".csv"
 _XLS = ".xlsx"
-_EXISTS = "'.csv or .xlsx already exists."
+_EXISTS = " already exists."
 _NOT_EXIST = "' does not exist."
 _OVERWRITE = " Will overwrite."
 
@@ -57,8 +61,27 @@ _PKG_REM = "Package removed"
 _LIC_CHG = "License change"
 _VER_CHG = "Version change"
 
+# Cell highlight colors used in the changes Excel-file
+_COLOR_PKG = "FFFF00"  # yellow
+_COLOR_VER = "008000"  # green
+_COLOR_LIC = "FF0000"  # red
+# Change marker column, highlighted columns and the color for them
+_CHANGE_HIGHLIGHTS = (
+    (_PKG_ADD, [_PKG, _CURR_REC, _CURR_VER, _CURR_LIC], _COLOR_PKG),
+    (_PKG_REM, [_PKG, _PREV_REC, _PREV_VER, _PREV_LIC], _COLOR_PKG),
+    (_VER_CHG, [_PREV_VER, _CURR_VER], _COLOR_VER),
+    (_LIC_CHG, [_PREV_LIC, _CURR_LIC], _COLOR_LIC),
+)
+
 _DATA_SHEET_NAME = "sheet1"
 
+_READ_CHUNK = 1024 * 1024  # characters read from a manifest file at a time
+# One package entry in the Yocto license manifest file
+_MANIFEST_RE = re.compile(
+    "PACKAGE NAME: (.*)\nPACKAGE VERSION: (.*)\nRECIPE NAME: (.*)\n"
+    "LICENSE: (.*)\n\n"
+)
+
 
 def _print_help():
 
@@ -90,6 +113,27 @@ def _print_help():
     print(" --verbose   verbose output")
     print(" --debug     debug level output")
     print(" --force     enable overwriting of existing output files")
+    print(" --no-xlsx   generate only the CSV-file, no Excel-file")
+
+
+# read_entry_chunks - read an opened manifest file in chunks, each chunk
+#                     ends at an entry boundary (empty line).
+#
+def read_entry_chunks(f_h):
+    """Yield the content of file f_h in pieces ending with an empty line."""
+    # Read the file in chunks, so that the whole file does not need to be
+    # kept in memory. Parts of an entry are kept for the next chunk.
+    buf = ""
+    while True:
+        chunk = f_h.read(_READ_CHUNK)
+        if not chunk:
+            yield buf
+            return
+        buf += chunk
+        cut = buf.rfind("\n\n") + 2
+        if cut >= 2:
+            yield buf[:cut]
+            buf = buf[cut:]
 
 
 # read_manifest_file - read Yocto license manifest and turn into a Panda's
@@ -97,69 +141,86 @@ def _print_help():
 #
 def read_manifest_file(input_file):
     """Read manifest file and return a Panda's dataframe ."""
-    pattern = re.compile(
-        "PACKAGE NAME: (.*)\nPACKAGE VERSION: (.*)\nRECIPE NAME: (.*)\n"
-        "LICENSE: (.*)\n\n"
-    )
+    import pandas as pd
+
+    column_names = [_PKG, "version", "recipe", "license"]
+    # Collect the rows first, the dataframe is built once at the end.
+    # Appending to a dataframe copies it on every call.
+    rows = []
+
+    package_count = 0
+    errors = False
+    prew = 0
+    data_len = 0  # characters of the file parsed so far
+    num_lines = 1
     with open(input_file, "r", encoding="utf8") as f_h:
-        data = f_h.read()
-        # Create empty dataframe
-        column_names = [_PKG, "version", "recipe", "license"]
-        d_f = pd.DataFrame(columns=column_names)
-
-        package_count = 0
-        errors = False
-        prew = 0
-        for info_field in re.finditer(pattern, data):
-            package_count += 1
-            if info_field.span()[0] != prew:
-                print(
-                    "ERROR - Invalid content in the file, got "
-                    + str(package_count)
-                    + " packages."
+        for data in read_entry_chunks(f_h):
+            num_lines += data.count("\n")
+            for info_field in _MANIFEST_RE.finditer(data):
+                package_count += 1
+                if data_len + info_field.start() != prew:
+                    print(
+                        "ERROR - Invalid content in the file, got "
+                        + str(package_count)
+                        + " packages."
+                    )
+                    # There is some content not matching the pattern in file.
+                    errors = True
+                prew = data_len + info_field.end()
+
+                rows.append(
+                    (
+                        info_field.group(1),
+                        info_field.group(2),
+                        info_field.group(3),
+                        info_field.group(4),
+                    )
                 )
-                # There is some content not matching the pattern in file.
-                errors = True
-            prew = info_field.span()[1]
-
-            new_row = {
-                column_names[0]: info_field.group(1),
-                column_names[1]: info_field.group(2),
-                column_names[2]: info_field.group(3),
-                column_names[3]: info_field.group(4),
-            }
-            d_f = d_f.append(new_row, ignore_index=True)
-
-        if (
-            package_count == 0
-        ):  # needs to have at least one package or it is an error
-            print("Package count is zero")
-            errors = True
-
-        data_len = len(data)
-        if data_len != prew:
-            # if not all data was matched it is an error
-            print(
-                "ERROR - Invalid content at end of file, got "
-                + str(package_count)
-                + " packages."
-            )
-            errors = True
-
-        num_lines = sum(1 for line in data.split("\n"))
-        status = {
-            "lines": num_lines,
-            "packages": package_count,
-            "errors": errors,
-        }
+            data_len += len(data)
+    d_f = pd.DataFrame(rows, columns=column_names)
+
+    if package_count == 0:
+        # needs to have at least one package or it is an error
+        print("Package count is zero")
+        errors = True
+
+    if data_len != prew:
+        # if not all data was matched it is an error
+        print(
+            "ERROR - Invalid content at end of file, got "
+            + str(package_count)
+            + " packages."
+        )
+        errors = True
+
+    status = {
+        "lines": num_lines,
+        "packages": package_count,
+        "errors": errors,
+    }
     return d_f, status
 
 
+# write_csv - write dataframe to a CSV-file with the csv module, there
+#             is no need for pandas' formatting machinery for plain strings.
+#
+def write_csv(output, d_f):
+    """Write dataframe (d_f) rows to CSV-file (output)."""
+    if d_f.isna().values.any():
+        # Missing values are written as empty fields
+        d_f = d_f.astype(object).fillna("")
+    with open(output, "w", newline="", encoding="utf8") as f_h:
+        writer = csv.writer(f_h, lineterminator="\n")
+        writer.writerow(d_f.columns)
+        writer.writerows(d_f.itertuples(index=False, name=None))
+
+
 # gen_list - generate list-formatted files from a license manifest file
 #            filenames of input file and output filename base needed as
-#            parameters. Two output files are created, file.csv and .xlsx.
+#            parameters. Two output files are created, file.csv and .xlsx
+#            (only .csv, if xlsx is False).
 #
-def gen_list(inputfile, outputfile):
+def gen_list(inputfile, outputfile, xlsx=True):
     """
     gen_list - generate list.
 
@@ -173,12 +234,13 @@ def gen_list(inputfile, outputfile):
 
     # Export CSV, if no errors noticed
     if status["errors"] is False:
-        d_f.to_csv(outputfile + _CSV, index=False)
-        generate_excel(
-            outputfile + _XLS,
-            d_f.style,
-            template_file="excel-template-list.xlsx",
-        )
+        write_csv(outputfile + _CSV, d_f)
+        if xlsx:
+            generate_excel(
+                outputfile + _XLS,
+                d_f,
+                template_file="excel-template-list.xlsx",
+            )
     else:
         print("ERROR - could not process license manifest file " + inputfile)
         sys.exit(71)  # EPROTO
@@ -222,6 +284,62 @@ def print_change_summary(chg_sum):
     print("Version changes: ", chg_sum[_VER_CHG])
 
 
+# check_duplicate_packages - exit with error if a package is listed more than
+#                            once in the manifest (name = file name).
+#
+def check_duplicate_packages(name, d_f):
+    """Check that package names in dataframe d_f are unique."""
+    # Package names are the join key, they must be unique in both files
+    duplicates = d_f[_PKG][d_f[_PKG].duplicated()].unique()
+    if len(duplicates) > 0:
+        print(
+            "ERROR - duplicate packages in '"
+            + name
+            + "': "
+            + ", ".join(duplicates)
+        )
+        sys.exit(71)  # EPROTO
+
+
+# merge_manifests  - outer join of previous and current manifest dataframes
+#                    on the package name.
+#
+def merge_manifests(d_f_prev, d_f_curr):
+    """Merge previous and current manifest dataframes into one."""
+    import pandas as pd
+
+    # Outer join on the package name done with plain dicts, it is cheaper
+    # than pd.merge for string keys. Packages only found in the current
+    # manifest come last, missing values are left as None.
+    prev_cols = [_PREV_VER, _PREV_REC, _PREV_LIC]
+    curr_cols = [_CURR_VER, _CURR_REC, _CURR_LIC]
+    prev_map = dict(
+        zip(d_f_prev[_PKG], zip(*(d_f_prev[col] for col in prev_cols)))
+    )
+    curr_map = dict(
+        zip(d_f_curr[_PKG], zip(*(d_f_curr[col] for col in curr_cols)))
+    )
+    missing = (None,) * 3
+    packages = list(prev_map)
+    packages.extend(pkg for pkg in curr_map if pkg not in prev_map)
+    d_f_combo = pd.DataFrame(
+        [
+            (pkg,) + prev_map.get(pkg, missing) + curr_map.get(pkg, missing)
+            for pkg in packages
+        ],
+        columns=[_PKG] + prev_cols + curr_cols,
+    )
+    # Versions, recipes and licenses repeat a lot, keep them as categoricals.
+    # Previous and current columns share the categories, so comparing them
+    # compares integer codes instead of strings.
+    for prev_col, curr_col in zip(prev_cols, curr_cols):
+        both = pd.concat([d_f_combo[prev_col], d_f_combo[curr_col]])
+        dtype = pd.CategoricalDtype(both.dropna().unique())
+        d_f_combo[prev_col] = d_f_combo[prev_col].astype(dtype)
+        d_f_combo[curr_col] = d_f_combo[curr_col].astype(dtype)
+    return d_f_combo
+
+
 # read_and_merge_manifests  - read previous and current manifest files
 #                             and return a merged dataframe with their content.
 
@@ -256,23 +374,28 @@ def read_and_merge_manifests(previous, current):
         sys.exit(71)  # EPROTO
     print(current + " " + str(status_curr))
 
+    check_duplicate_packages(previous, d_f_prev)
+    check_duplicate_packages(current, d_f_curr)
+
     # 1st create a merged table that has both previous and current information
     logging.info("Merging dataframes...")
-    d_f_combo = pd.merge(d_f_prev, d_f_curr, on=_PKG, how="outer")
+    d_f_combo = merge_manifests(d_f_prev, d_f_curr)
     logging.debug(d_f_combo)
     return d_f_combo
 
 
 # gen_changes - generate change information based on two Yocto
-#               license manifest files
+#               license manifest files, no Excel-file if xlsx is False
 #
-def gen_changes(previous, current, output):
+def gen_changes(previous, current, output, xlsx=True):
     """
     gen_list - generate list.
 
     Generate list formatted change output (.csv and .xlsx)
     from 2 manifest files.
     """
+    import pandas as pd
+
     logging.debug("gen_changes: '%s', '%s', '%s'", previous, current, output)
     # Read the manifests, get them merged into one combined dataframe
     d_f_combo = read_and_merge_manifests(previous, current)
@@ -282,157 +405,72 @@ def gen_changes(previous, current, output):
     # Not going to consider recipe change a change worth high-lighting,
     # that is not relevant from Third Party IP point of view.
 
-    d_f_combo[[_CHG, _VER_CHG, _LIC_CHG, _PKG_ADD, _PKG_REM]] = ""
-    i = 0
-    rows = d_f_combo.shape[0]
-    styled = d_f_combo.style
     change_summary = init_change_summary()  # Get dict for collecting changes
-    while i < rows:
-        # Check package appearing, start by setting change is "n"
-        package_change = False
-        if pd.isna(d_f_combo.at[i, _PREV_REC]):  # NaN
-            d_f_combo.at[i, _CHG] = _MARK_CHG
-            d_f_combo.at[i, _PKG_ADD] = _MARK_CHG
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_CURR_REC),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PKG),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_CURR_VER),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_CURR_LIC),
-                color="yellow",
-                axis=None,
-            )
-            package_change = True
-            change_summary[_PKG_ADD] += 1
-        # Package removed
-        if package_change is False and pd.isna(
-            d_f_combo.at[i, _CURR_REC]
-        ):  # NaN
-            d_f_combo.at[i, _CHG] = _MARK_CHG
-            d_f_combo.at[i, _PKG_REM] = _MARK_CHG
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PREV_REC),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PREV_VER),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PKG),
-                color="yellow",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PREV_LIC),
-                color="yellow",
-                axis=None,
-            )
-            package_change = True
-            change_summary[_PKG_REM] += 1
-        # Version change
-        if (
-            package_change is False
-            and d_f_combo.at[i, _PREV_VER] != d_f_combo.at[i, _CURR_VER]
-        ):
-            d_f_combo.at[i, _CHG] = _MARK_CHG
-            d_f_combo.at[i, _VER_CHG] = _MARK_CHG
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PREV_VER),
-                color="green",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_CURR_VER),
-                color="green",
-                axis=None,
-            )
-            change_summary[_VER_CHG] += 1
-        # License change
-        if (
-            package_change is False
-            and d_f_combo.at[i, _PREV_LIC] != d_f_combo.at[i, _CURR_LIC]
-        ):
-            d_f_combo.at[i, _CHG] = _MARK_CHG
-            d_f_combo.at[i, _LIC_CHG] = _MARK_CHG
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_PREV_LIC),
-                color="red",
-                axis=None,
-            )
-            styled = styled.apply(
-                style_single_cell,
-                row=i,
-                column=d_f_combo.columns.get_loc(_CURR_LIC),
-                color="red",
-                axis=None,
-            )
-            change_summary[_LIC_CHG] += 1
-        # No changes cases is the default, as we set all
-        # change columns to n at start
-        i = i + 1
+
+    # Classify all rows at once with boolean masks. A package that was
+    # added or removed is not reported as a version or license change.
+    added = d_f_combo[_PREV_REC].isna()
+    removed = ~added & d_f_combo[_CURR_REC].isna()
+    unchanged_pkg = ~added & ~removed
+    ver_chg = unchanged_pkg & d_f_combo[_PREV_VER].ne(d_f_combo[_CURR_VER])
+    lic_chg = unchanged_pkg & d_f_combo[_PREV_LIC].ne(d_f_combo[_CURR_LIC])
+
+    # Change columns are written as whole columns, no changes is "".
+    # They only ever hold two values, so keep them as categoricals built
+    # straight from the masks instead of columns of string objects.
+    any_chg = added | removed | ver_chg | lic_chg
+    for column, mask in (
+        (_CHG, any_chg),
+        (_VER_CHG, ver_chg),
+        (_LIC_CHG, lic_chg),
+        (_PKG_ADD, added),
+        (_PKG_REM, removed),
+    ):
+        d_f_combo[column] = pd.Categorical.from_codes(
+            mask.to_numpy(dtype="int8"), categories=["", _MARK_CHG]
+        )
+    change_summary[_PKG_ADD] = int(added.sum())
+    change_summary[_PKG_REM] = int(removed.sum())
+    change_summary[_VER_CHG] = int(ver_chg.sum())
+    change_summary[_LIC_CHG] = int(lic_chg.sum())
+
     # Export result out
     logging.info("Export CSV: %s ", output + _CSV)
-    d_f_combo.to_csv(path_or_buf=output + _CSV, index=False)
-    logging.info("Export Excel: %s", output + _XLS)
-    generate_excel(
-        output=output + _XLS,
-        styled=styled,
-        template_file="excel-template-changes.xlsx",
-    )
+    write_csv(output + _CSV, d_f_combo)
+    if xlsx:
+        logging.info("Export Excel: %s", output + _XLS)
+        generate_excel(
+            output=output + _XLS,
+            d_f=d_f_combo,
+            template_file="excel-template-changes.xlsx",
+            highlights=_CHANGE_HIGHLIGHTS,
+        )
     print_change_summary(change_summary)
 
 
 #
 # generate_excel   output = output filename,
-#                  styled = styled Pandas dataframe
+#                  d_f = Pandas dataframe
+#                  highlights = (marker column, columns, color) rules, see
+#                               add_highlights()
 #
-def generate_excel(output, styled, template_file=None):
-    """Generate Excel-file (output) from styled Panda's dataframe."""
-    # Add autofilters to Excel sheet
-    # pylint: disable=abstract-class-instantiated
-    writer = pd.ExcelWriter(output, engine="openpyxl")
+def generate_excel(output, d_f, template_file=None, highlights=()):
+    """Generate Excel-file (output) from Panda's dataframe."""
+    import pandas as pd
 
+    # Add autofilters to Excel sheet
     if template_file:
-        template_book = load_workbook(template_file)
-        writer.book = template_book
+        # Start from a copy of the template and add the data sheet to it,
+        # this way the writer loads the workbook itself.
+        with open(output, "wb") as f_h:
+            f_h.write(read_template(template_file))
+        # pylint: disable=abstract-class-instantiated
+        writer = pd.ExcelWriter(output, engine="openpyxl", mode="a")
+    else:
+        # pylint: disable=abstract-class-instantiated
+        writer = pd.ExcelWriter(output, engine="openpyxl")
 
-    styled.to_excel(writer, sheet_name=_DATA_SHEET_NAME, index=False)
+    d_f.to_excel(writer, sheet_name=_DATA_SHEET_NAME, index=False)
 
     # Get the xlsxwriter workbook and worksheet objects.
     # pylint: disable=E1101
@@ -449,31 +487,74 @@ def generate_excel(output, styled, template_file=None):
 
     worksheet.auto_filter.ref = worksheet.dimensions
 
-    colum_names = []
-    for cell in worksheet[1]:
-        colum_names.append(str(cell.value))
-
     # set default width of colums to match the title
-    for col in range(worksheet.min_column, worksheet.max_column + 1):
-        worksheet.column_dimensions[get_column_letter(col)].width = (
-            len(colum_names[col - 1]) + 5
+    for letter, width in column_widths(d_f.columns):
+        worksheet.column_dimensions[letter].width = width
+
+    add_highlights(worksheet, d_f, highlights)
+    writer.close()
+
+
+#
+# add_highlights - add conditional formatting rules to the worksheet,
+#                  cells in columns are filled with color when the
+#                  marker column of the same row is marked changed.
+#
+def add_highlights(worksheet, d_f, highlights):
+    """Add highlight rules for dataframe d_f written to worksheet."""
+    from openpyxl.formatting.rule import FormulaRule
+    from openpyxl.styles import PatternFill
+    from openpyxl.utils import get_column_letter
+
+    # One rule per highlight instead of styling each changed cell, Excel
+    # evaluates the rules when the sheet is shown.
+    last_row = len(d_f) + 1
+    if last_row < 2:
+        return
+    for marker, columns, color in highlights:
+        marker_col = get_column_letter(d_f.columns.get_loc(marker) + 1)
+        ranges = " ".join(
+            f"{letter}2:{letter}{last_row}"
+            for letter in (
+                get_column_letter(d_f.columns.get_loc(col) + 1)
+                for col in columns
+            )
+        )
+        worksheet.conditional_formatting.add(
+            ranges,
+            FormulaRule(
+                formula=[f'${marker_col}2="{_MARK_CHG}"'],
+                fill=PatternFill(
+                    start_color=color, end_color=color, fill_type="solid"
+                ),
+            ),
         )
 
-    writer.save()
+
+#
+# column_widths - default widths for Excel columns, title length + 5
+#
+def column_widths(columns):
+    """Return (column letter, width) pairs for the column titles."""
+    import pandas as pd
+    from openpyxl.utils import get_column_letter
+
+    widths = (pd.Index(columns).astype(str).str.len() + 5).tolist()
+    return zip(map(get_column_letter, range(1, len(widths) + 1)), widths)
 
 
 #
-# style_single_cell - set background color on a cell
+# read_template - read an Excel template file, the content is cached
+#                 so that each template is read only once.
 #
-def style_single_cell(work_sheet, row, column, color):
-    """Set a single cell to a specific color."""
-    new_color = f"background-color:  {color}"
-    df1 = pd.DataFrame("", index=work_sheet.index, columns=work_sheet.columns)
-    df1.iloc[row, column] = new_color
-    return df1
+@functools.lru_cache(maxsize=2)
+def read_template(template_file):
+    """Return the content of Excel template file (template_file)."""
+    with open(template_file, "rb") as f_h:
+        return f_h.read()
 
 
-def _parse_args():
+def _parse_args(argv=None):
 
     parser = argparse.ArgumentParser()
 
@@ -516,6 +597,12 @@ def _parse_args():
         help="Force overwrite of existing output file",
         action="store_true",
     )
+    parser.add_argument(
+        "--no-xlsx",
+        help="Generate only the CSV-file, skip the Excel-file",
+        action="store_false",
+        dest="xlsx",
+    )
     parser.add_argument(
         "--verbose",
         help="Verbose diagnostics",
@@ -531,8 +618,11 @@ def _parse_args():
         const=logging.DEBUG,
         default=logging.WARNING,
     )
-    args, unknown = parser.parse_known_args()
+    args, unknown = parser.parse_known_args(argv)
     logging.basicConfig(level=args.loglevel, format="")
+    # basicConfig() does nothing when already configured, e.g. when main()
+    # is called again in the same process, so set the level explicitly.
+    logging.getLogger().setLevel(args.loglevel or logging.WARNING)
     if not args.command:
         _print_help()
         sys.exit(0)
@@ -543,6 +633,30 @@ def _parse_args():
     return args
 
 
+# check_output_files - check the output files to be written do not exist,
+#                      unless overwriting them has been forced.
+#
+def check_output_files(outputfile, args):
+    """Exit if output files of outputfile base exist without --force."""
+    exts = (_CSV, _XLS) if args.xlsx else (_CSV,)
+    exists = "'" + " or ".join(exts) + _EXISTS
+    if any(os.path.isfile(outputfile + ext) for ext in exts):
+        if not args.force:
+            print("ERROR - output file: '" + outputfile + exists)
+            sys.exit(2)  # ENOENT
+        else:
+            print(
+                "Warning - output file: '" + outputfile + exists + _OVERWRITE
+            )
+    if not args.xlsx and os.path.isfile(outputfile + _XLS):
+        # Not written, it will not match the new .csv file
+        print(
+            "Warning - output file: '"
+            + outputfile
+            + "'.xlsx exists, it will not be updated (--no-xlsx)."
+        )
+
+
 # parse_list - handle the case of list option sanitizing/checking
 #
 def parse_list(args):
@@ -550,20 +664,8 @@ def parse_list(args):
     if not os.path.isfile(args.inputfile):
         print("ERROR - input file: '" + args.inputfile + "' does not exist.")
         sys.exit(2)  # ENOENT
-    if os.path.isfile(args.listfile + _CSV) or os.path.isfile(
-        args.listfile + _XLS
-    ):
-        if not args.force:
-            print("ERROR - output file: '" + args.listfile + _EXISTS)
-            sys.exit(2)  # ENOENT
-        else:
-            print(
-                "Warning - output file: '"
-                + args.listfile
-                + _EXISTS
-                + _OVERWRITE
-            )
-    gen_list(args.inputfile, args.listfile)
+    check_output_files(args.listfile, args)
+    gen_list(args.inputfile, args.listfile, xlsx=args.xlsx)
 
 
 # parse_changes - handle the case of changes option sanitizing/checking
@@ -576,30 +678,19 @@ def parse_changes(args):
     if not os.path.isfile(args.current):
         print("ERROR - current license file: '" + args.current + _NOT_EXIST)
         sys.exit(2)  # ENOENT
-    if os.path.isfile(args.changefile + _CSV) or os.path.isfile(
-        args.changefile + _XLS
-    ):
-        if not args.force:
-            print("ERROR - output file: '" + args.changefile + _EXISTS)
-            sys.exit(2)  # ENOENT
-        else:
-            print(
-                "Warning - output file: '"
-                + args.changefile
-                + _EXISTS
-                + _OVERWRITE
-            )
-    gen_changes(args.previous, args.current, args.changefile)
+    check_output_files(args.changefile, args)
+    gen_changes(args.previous, args.current, args.changefile, xlsx=args.xlsx)
 
 
-def main():
-    """Script entry point."""
-    args = _parse_args()
+def main(argv=None):
+    """Script entry point, argv defaults to the command line arguments."""
+    args = _parse_args(argv)
     if args.command == "list":
         parse_list(args)
 
     if args.command == "changes":
         parse_changes(args)
+    return 0
 
 
 if __name__ == "__main__":
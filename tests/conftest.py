@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# conftest - shared pytest fixtures for the licensetool test cases
+#
+# Copyright (c) 2021, Pelion Limited and affiliates.
+# Copyright (c) 2022 Izuma Networks
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared fixtures for the licensetool test cases."""
+
+import sys
+import shlex
+import shutil
+from pathlib import Path
+import pandas as pd
+import pytest
+
+# Workaround for the module not found problem,
+# tests will at least run with Python 3.10.
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+# pylint: disable=wrong-import-position
+import licensetool  # noqa
+
+_LIST_3PKG = "list tests/3-packages.manifest "
+_CHG_3PKG = "changes tests/3-packages.manifest tests/3-packages.manifest.v2 "
+
+
+# _run_tool - run licensetool in-process, return exit code like the shell.
+#
+def _run_tool(cmdline):
+    """Run licensetool main() with cmdline arguments, return exit code."""
+    try:
+        ret = licensetool.main(shlex.split(cmdline))
+    except SystemExit as exc:
+        ret = exc.code
+    return ret or 0
+
+
+@pytest.fixture(name="run_tool")
+def fixture_run_tool():
+    """
+    Return function running licensetool with given arguments.
+
+    Runs main() in the test process instead of starting a new Python
+    (and importing pandas) for each command.
+    """
+    return _run_tool
+
+
+@pytest.fixture(name="three_pkg_manifest", scope="session")
+def fixture_three_pkg_manifest():
+    """Return (dataframe, status) of tests/3-packages.manifest, read once."""
+    return licensetool.read_manifest_file("tests/3-packages.manifest")
+
+
+@pytest.fixture(name="three_pkg_ref_csv", scope="session")
+def fixture_three_pkg_ref_csv():
+    """Return reference dataframe of tests/3-packages.csv, read once."""
+    return pd.read_csv("tests/3-packages.csv")
+
+
+# _copy_outputs - copy prebuilt .csv/.xlsx outputs as tmpdir/out.csv/.xlsx
+#
+def _copy_outputs(base, tmpdir):
+    """Copy outputs of name base into tmpdir, return new name base."""
+    outbase = str(tmpdir.join("out"))
+    for ext in (".csv", ".xlsx"):
+        shutil.copyfile(str(base) + ext, outbase + ext)
+    return outbase
+
+
+@pytest.fixture(name="prebuilt_list_output", scope="session")
+def fixture_prebuilt_list_output(tmp_path_factory):
+    """Return name base of list outputs of 3-packages.manifest, built once."""
+    base = tmp_path_factory.mktemp("prebuilt") / "list"
+    assert _run_tool(_LIST_3PKG + str(base)) == 0
+    return base
+
+
+@pytest.fixture(name="prebuilt_changes_output", scope="session")
+def fixture_prebuilt_changes_output(tmp_path_factory):
+    """Return name base of changes outputs of 3-packages v1/v2, built once."""
+    base = tmp_path_factory.mktemp("prebuilt") / "changes"
+    assert _run_tool(_CHG_3PKG + str(base)) == 0
+    return base
+
+
+@pytest.fixture(name="existing_list_output")
+def fixture_existing_list_output(tmpdir, prebuilt_list_output):
+    """Return output name base in tmpdir with list outputs already there."""
+    return _copy_outputs(prebuilt_list_output, tmpdir)
+
+
+@pytest.fixture(name="existing_changes_output")
+def fixture_existing_changes_output(tmpdir, prebuilt_changes_output):
+    """Return output name base in tmpdir with changes outputs already there."""
+    return _copy_outputs(prebuilt_changes_output, tmpdir)
@@ -24,13 +24,12 @@
 """Licensetool test cases for the changes argument/functionality."""
 
 import sys
-import os
 from pathlib import Path
 import pandas as pd
+from pandas.testing import assert_frame_equal
+from openpyxl import load_workbook
 
-_PY_LCTOOL_CHANGES_PACK = (
-    "python licensetool.py changes tests/3-packages.manifest "
-)
+_PY_LCTOOL_CHANGES_PACK = "changes tests/3-packages.manifest "
 
 # Workaround for the module not found problem,
 # tests will at least run with Python 3.10.
@@ -43,84 +42,135 @@ from licensetool import _DATA_SHEET_NAME  # noqa
 
 
 # Test previous empty file
-def test_empty_license_prev(tmpdir):
+def test_empty_license_prev(tmpdir, run_tool):
     """Test with empty 1st file (fail)"""
     tmp_outfiles = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py changes tests/empty_file.manifest "
+    ret = run_tool(
+        "changes tests/empty_file.manifest "
         "tests/3-packages.manifest.v2 " + tmp_outfiles
     )
     assert ret != 0
 
 
 # Test empty current file
-def test_empty_license_curr(tmpdir):
+def test_empty_license_curr(tmpdir, run_tool):
     """Test with empty 2nd input file (fail)"""
     tmp_outfiles = str(tmpdir.join("out"))
-    ret = os.system(
+    ret = run_tool(
         _PY_LCTOOL_CHANGES_PACK + "tests/empty_file.manifest " + tmp_outfiles
     )
     assert ret != 0
 
 
 # If output file exists, it should refuse to overwrite
-def test_outfile_exists(tmpdir):
+def test_outfile_exists(run_tool, existing_changes_output):
     """
     Test overwrite protection (fail, will not overwrite without --force option)
     """
-    tmp_outfiles = str(tmpdir.join("out"))
-    # 1st run - create the file out.csv/.xlsx
-    ret = os.system(
-        _PY_LCTOOL_CHANGES_PACK
-        + "tests/3-packages.manifest.v2 "
-        + tmp_outfiles
-    )
-    assert ret == 0
-    # 2nd run must fail, files now already exist (out.csv/out.xlsx)
-    ret = os.system(
+    # Run must fail, files already exist (out.csv/out.xlsx)
+    ret = run_tool(
         _PY_LCTOOL_CHANGES_PACK
         + "tests/3-packages.manifest.v2 "
-        + tmp_outfiles
+        + existing_changes_output
     )
     assert ret != 0
 
 
 # Invalid previous
-def test_invalid_previous(tmpdir):
+def test_invalid_previous(tmpdir, run_tool):
     """Test with broken 1st input file (fail)"""
     tmp_outfiles = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py changes tests/broken.manifest "
+    ret = run_tool(
+        "changes tests/broken.manifest "
         "tests/3-packages.manifest " + tmp_outfiles
     )
     assert ret != 0
 
 
 # Invalid current
-def test_invalid_current(tmpdir):
+def test_invalid_current(tmpdir, run_tool):
     """Test with broken 2nd input file (fail)"""
     tmp_outfiles = str(tmpdir.join("out"))
-    ret = os.system(
+    ret = run_tool(
         _PY_LCTOOL_CHANGES_PACK + "tests/broken.manifest " + tmp_outfiles
     )
     assert ret != 0
 
 
 # Success case
-def test_changes_v1_v2(tmpdir):
+def test_changes_v1_v2(tmpdir, run_tool):
     """Test normal success case (success)"""
     tmp_outfiles = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py changes tests/changes-test.v1 "
+    ret = run_tool(
+        "changes tests/changes-test.v1 "
         "tests/changes-test.v2 " + tmp_outfiles
     )
     assert ret == 0
     # Compare result, too
     ref_df = pd.read_csv("tests/test-changes.csv")
     result_df = pd.read_csv(tmp_outfiles + ".csv")
-    assert result_df.equals(ref_df)
+    assert_frame_equal(result_df, ref_df)
     # Also the Excel-version
     xl_result_df = pd.read_excel(
         tmp_outfiles + ".xlsx", sheet_name=_DATA_SHEET_NAME, engine="openpyxl"
     )
-    assert xl_result_df.equals(ref_df)
+    assert_frame_equal(xl_result_df, ref_df)
+
+
+# Duplicate package in previous
+def test_duplicate_previous(tmpdir, run_tool):
+    """Test with duplicate package in 1st input file (fail)"""
+    tmp_outfiles = str(tmpdir.join("out"))
+    ret = run_tool(
+        "changes tests/duplicate.manifest "
+        "tests/3-packages.manifest " + tmp_outfiles
+    )
+    assert ret != 0
+
+
+# Duplicate package in current
+def test_duplicate_current(tmpdir, run_tool):
+    """Test with duplicate package in 2nd input file (fail)"""
+    tmp_outfiles = str(tmpdir.join("out"))
+    ret = run_tool(
+        _PY_LCTOOL_CHANGES_PACK + "tests/duplicate.manifest " + tmp_outfiles
+    )
+    assert ret != 0
+
+
+# Changes are highlighted with conditional formatting
+def test_changes_v1_v2_highlights(tmpdir, run_tool):
+    """Test highlight rules of the changes Excel-file (success)"""
+    tmp_outfiles = str(tmpdir.join("out"))
+    ret = run_tool(
+        "changes tests/changes-test.v1 "
+        "tests/changes-test.v2 " + tmp_outfiles
+    )
+    assert ret == 0
+    worksheet = load_workbook(tmp_outfiles + ".xlsx")[_DATA_SHEET_NAME]
+    rules = {
+        str(c_f.sqref): (rule.formula, rule.dxf.fill.fgColor.rgb)
+        for c_f in worksheet.conditional_formatting
+        for rule in c_f.rules
+    }
+    assert rules == {
+        "A2:A7 E2:E7 F2:F7 G2:G7": (['$K2="y"'], "00FFFF00"),
+        "A2:A7 B2:B7 C2:C7 D2:D7": (['$L2="y"'], "00FFFF00"),
+        "B2:B7 E2:E7": (['$I2="y"'], "00008000"),
+        "D2:D7 G2:G7": (['$J2="y"'], "00FF0000"),
+    }
+
+
+# Diagnostics of each manifest are printed together with its status
+def test_invalid_current_messages(tmpdir, run_tool, capsys):
+    """Test errors of 2nd input file are printed after 1st file (fail)"""
+    tmp_outfiles = str(tmpdir.join("out"))
+    ret = run_tool(
+        _PY_LCTOOL_CHANGES_PACK
+        + "tests/3-packages.manifest.nolines "
+        + tmp_outfiles
+    )
+    assert ret != 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("tests/3-packages.manifest {")
+    assert lines[1].startswith("ERROR - Invalid content at end of file")
@@ -24,182 +24,188 @@
 import os
 
 # SonarQube duplication fix - success case as literal
-_PY_LCTOOL_LIST_3MANIFESTS = (
-    "python licensetool.py list tests/3-packages.manifest "
-)
+_PY_LCTOOL_LIST_3MANIFESTS = "list tests/3-packages.manifest "
 _PY_LCTOOL_CHG_3MANIFESTS = (
-    "python licensetool.py changes tests/3-packages.manifest "
-    "tests/3-packages.manifest.v2 "
+    "changes tests/3-packages.manifest tests/3-packages.manifest.v2 "
 )
 
 
-def test_no_params():
+def test_no_params(run_tool):
     """Test with no parameters (success, print help)"""
-    ret = os.system("python licensetool.py")
+    ret = run_tool("")
     assert ret == 0
 
 
-def test_list_only():
+def test_list_only(run_tool):
     """Test with list argument only (fail)"""
-    ret = os.system("python licensetool.py list")
+    ret = run_tool("list")
     assert ret != 0
 
 
-def test_list_non_valid_option():
+def test_list_non_valid_option(run_tool):
     """Test with non-valid option (fail)"""
-    ret = os.system("python licensetool.py list --nonvalidoption")
+    ret = run_tool("list --nonvalidoption")
     assert ret != 0
 
 
-def test_list_input_only():
+def test_list_input_only(run_tool):
     """Test with list and only input file (fail)"""
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS)
+    ret = run_tool(_PY_LCTOOL_LIST_3MANIFESTS)
     assert ret != 0
 
 
-def test_list_input_output(tmpdir):
-    """Test list with input and valid output (success)"""
+def test_list_input_output(tmpdir, run_tool):
+    """Test list with input and valid output, CSV only (success)"""
     tmp_outfilebase = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfilebase)
+    ret = run_tool("--no-xlsx " + _PY_LCTOOL_LIST_3MANIFESTS + tmp_outfilebase)
     assert ret == 0
+    assert tmpdir.join("out.csv").check()
+    assert not tmpdir.join("out.xlsx").check()
 
 
-def test_list_input_missing(tmpdir):
+def test_list_input_missing(tmpdir, run_tool):
     """Test list with non-existent input file (fail)"""
     tmp_outfilebase = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py list non-existent-file " + tmp_outfilebase
-    )
+    ret = run_tool("list non-existent-file " + tmp_outfilebase)
     assert ret != 0
 
 
-def test_list_extra_param_at_end(tmpdir):
+def test_list_extra_param_at_end(tmpdir, run_tool):
     """Test list with extra parameter at end (fail)"""
     tmp_outfilebase = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfilebase + " extra")
+    ret = run_tool(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfilebase + " extra")
     assert ret != 0
 
 
-def test_list_broken_manifest(tmpdir):
+def test_list_broken_manifest(tmpdir, run_tool):
     """Test list with broken input file (fail)"""
     tmp_outfilebase = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py list tests/broken.manifest " + tmp_outfilebase
-    )
+    ret = run_tool("list tests/broken.manifest " + tmp_outfilebase)
     assert ret != 0
 
 
-def test_list_output_existing(tmpdir):
+def test_list_output_existing(run_tool, existing_list_output):
     """Test list with output file already existing (fail, don't overwrite)"""
-    tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfile)
-    # 1st time should pass.
-    assert ret == 0
-    # 2nd time must fail
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfile)
+    # out.csv and out.xlsx exist already, must fail
+    ret = run_tool(_PY_LCTOOL_LIST_3MANIFESTS + existing_list_output)
     assert ret != 0
 
 
-def test_list_forced_overwrite(tmpdir):
+def test_list_forced_overwrite(run_tool, existing_list_output):
     """Test list with forced overwrite input and valid output (success)"""
-    tmp_outfilebase = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_LIST_3MANIFESTS + tmp_outfilebase)
-    # This creates now out.csv and out.xlsx
+    # out.csv and out.xlsx exist already, overwrite them
+    ret = run_tool(
+        "--force list tests/3-packages.manifest " + existing_list_output
+    )
     assert ret == 0
-    # Now overwrite them
-    ret = os.system(
-        "python licensetool.py --force list tests/3-packages.manifest "
-        + tmp_outfilebase
+
+
+def test_list_no_xlsx_forced_overwrite(run_tool, existing_list_output):
+    """Test list CSV only with outputs existing, forced (success)"""
+    xlsx_mtime = os.path.getmtime(existing_list_output + ".xlsx")
+    ret = run_tool(
+        "--force --no-xlsx list tests/3-packages.manifest "
+        + existing_list_output
     )
     assert ret == 0
+    # Excel-file is not written, it must be left as it was
+    assert os.path.getmtime(existing_list_output + ".xlsx") == xlsx_mtime
 
 
-def test_changes_only():
+def test_list_no_xlsx_existing_xlsx(run_tool, existing_list_output):
+    """Test list CSV only with only Excel-file existing (success)"""
+    os.remove(existing_list_output + ".csv")
+    # Existing .xlsx is not written, it does not need --force
+    ret = run_tool(
+        "--no-xlsx list tests/3-packages.manifest " + existing_list_output
+    )
+    assert ret == 0
+    # But existing .csv does
+    ret = run_tool(
+        "--no-xlsx list tests/3-packages.manifest " + existing_list_output
+    )
+    assert ret != 0
+
+
+def test_changes_only(run_tool):
     """Test w changes option only (fail)"""
-    ret = os.system("python licensetool.py changes")
+    ret = run_tool("changes")
     assert ret != 0
 
 
-def test_changes_input2_missing():
+def test_changes_input2_missing(run_tool):
     """Test w changes option and one input file only (fail)"""
-    ret = os.system("python licensetool.py changes tests/3-packages.manifest ")
+    ret = run_tool("changes tests/3-packages.manifest ")
     assert ret != 0
 
 
-def test_changes_output_missing():
+def test_changes_output_missing(run_tool):
     """Test w changes option and one input file only (fail)"""
-    ret = os.system(
-        "python licensetool.py changes tests/3-packages.manifest "
-        "tests/3-packages.manifest.v2"
+    ret = run_tool(
+        "changes tests/3-packages.manifest tests/3-packages.manifest.v2"
     )
     assert ret != 0
 
 
-def test_changes_input1_not_existing(tmpdir):
+def test_changes_input1_not_existing(tmpdir, run_tool):
     """Test w changes option and non-existent input file (fail)"""
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py changes non-existent-file"
+    ret = run_tool(
+        "changes non-existent-file"
         " tests/3-packages.manifest.v2 " + tmp_outfile
     )
     assert ret != 0
 
 
-def test_changes_input2_not_existing(tmpdir):
+def test_changes_input2_not_existing(tmpdir, run_tool):
     """Test w changes option and non-existent 2nd input file (fail)"""
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py changes tests/3-packages.manifest"
+    ret = run_tool(
+        "changes tests/3-packages.manifest"
         " non-existent-file2 " + tmp_outfile
     )
     assert ret != 0
 
 
-def test_changes_unknown_option(tmpdir):
+def test_changes_unknown_option(tmpdir, run_tool):
     """Test w changes option and unknown option (fail)"""
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py --unknownoption changes "
+    ret = run_tool(
+        "--unknownoption changes "
         " tests/3-packages.manifest tests/3-packages.manifest.v2 "
         + tmp_outfile
     )
     assert ret != 0
 
 
-def test_changes_extra_param_at_end(tmpdir):
+def test_changes_extra_param_at_end(tmpdir, run_tool):
     """Test w changes extra parameter in the end (fail)"""
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile + " extra")
+    ret = run_tool(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile + " extra")
     assert ret != 0
 
 
-def test_changes_input_ok_output(tmpdir):
-    """Normal success case"""
+def test_changes_input_ok_output(tmpdir, run_tool):
+    """Normal success case, CSV only"""
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile)
+    ret = run_tool("--no-xlsx " + _PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile)
     assert ret == 0
+    assert tmpdir.join("out.csv").check()
+    assert not tmpdir.join("out.xlsx").check()
 
 
-def test_changes_output_existing(tmpdir):
+def test_changes_output_existing(run_tool, existing_changes_output):
     """Output existing, will not overwrite (fail)"""
-    tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile)
-    # 1st time should pass.
-    assert ret == 0
-    # 2nd time must fail
-    ret = os.system(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile)
+    # out.csv and out.xlsx exist already, must fail
+    ret = run_tool(_PY_LCTOOL_CHG_3MANIFESTS + existing_changes_output)
     assert ret != 0
 
 
-def test_changes_forced_overwrite(tmpdir):
+def test_changes_forced_overwrite(run_tool, existing_changes_output):
     """Output existing, forced overwrite (success)"""
-    tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(_PY_LCTOOL_CHG_3MANIFESTS + tmp_outfile)
-    # This creates now out.csv and out.xlsx
-    assert ret == 0
-    # Now overwrite them
-    ret = os.system(
-        "python licensetool.py --force changes "
-        "tests/3-packages.manifest tests/3-packages.manifest.v2 " + tmp_outfile
+    # out.csv and out.xlsx exist already, overwrite them
+    ret = run_tool(
+        "--force changes tests/3-packages.manifest "
+        "tests/3-packages.manifest.v2 " + existing_changes_output
     )
     assert ret == 0
@@ -22,11 +22,11 @@
 
 """Licensetool test cases for the list command argument."""
 
-
 import sys
-import os
 from pathlib import Path
 import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
 
 # Workaround for the module not found problem,
 # tests will at least run with Python 3.10.
@@ -40,39 +40,22 @@ import licensetool as t  # noqa
 from licensetool import _DATA_SHEET_NAME  # noqa
 
 
-# Test empty file
-def test_empty_license():
-    """Empty license file (fail)."""
-    d_f, status = t.read_manifest_file("tests/empty_file.manifest")
-    assert status["errors"] is True
-    assert d_f.empty is True
-
-
-# Test each of the lines (package, package version, recipe, license) missing
-def test_no_line1():
-    """Line1 (package) missing from manifest file (fail)."""
-    d_f, status = t.read_manifest_file("tests/no-line1.manifest")
-    assert status["errors"] is True
-    assert d_f.empty is True
-
-
-def test_no_line2():
-    """Line2 missing from manifest file (fail)."""
-    d_f, status = t.read_manifest_file("tests/no-line2.manifest")
-    assert status["errors"] is True
-    assert d_f.empty is True
-
-
-def test_no_line3():
-    """Line3 missing from manifest file (fail)."""
-    d_f, status = t.read_manifest_file("tests/no-line3.manifest")
-    assert status["errors"] is True
-    assert d_f.empty is True
-
-
-def test_no_line4():
-    """Line4 missing from manifest file (fail)."""
-    d_f, status = t.read_manifest_file("tests/no-line4.manifest")
+# Test empty file, broken file and each of the lines (package, package
+# version, recipe, license) missing - no packages are read from any of them.
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        "empty_file",
+        "no-line1",
+        "no-line2",
+        "no-line3",
+        "no-line4",
+        "broken",
+    ],
+)
+def test_bad_manifest(manifest):
+    """Empty or malformatted manifest file (fail)."""
+    d_f, status = t.read_manifest_file("tests/" + manifest + ".manifest")
     assert status["errors"] is True
     assert d_f.empty is True
 
@@ -84,44 +67,34 @@ def test_out_of_sync():
     assert d_f.empty is False  # There will be one entry in the DataFrame
 
 
-def test_broken_manifest():
-    """Broken/malformatted manifest file (fail)."""
-    d_f, status = t.read_manifest_file("tests/broken.manifest")
-    assert status["errors"] is True
-    assert d_f.empty is True
-
-
 # Test a known successfull cases, with 3 packages only.
-def test_3_packages():
+def test_3_packages(three_pkg_manifest, three_pkg_ref_csv):
     """Normal success case with 3 packages (success)"""
-    d_f, status = t.read_manifest_file("tests/3-packages.manifest")
+    d_f, status = three_pkg_manifest
     assert status["errors"] is False
     assert status["lines"] == 16
     assert status["packages"] == 3
     assert d_f.empty is False
-    ref_d_f = pd.read_csv("tests/3-packages.csv")
-    assert d_f.equals(ref_d_f)
+    assert_frame_equal(d_f, three_pkg_ref_csv)
 
 
 # Test a known successfull cases, with 3 packages only - via cli
 # so that we can verify also the xlsx -version.
-def test_3_packages_cli(tmpdir):
+def test_3_packages_cli(tmpdir, run_tool, three_pkg_ref_csv):
     """Normal success case with 3 packages via cli (success)"""
     # Also via cli for the Excel-version, too
     tmp_outfile = str(tmpdir.join("out"))
-    ret = os.system(
-        "python licensetool.py list tests/3-packages.manifest " + tmp_outfile
-    )
+    ret = run_tool("list tests/3-packages.manifest " + tmp_outfile)
     assert ret == 0
     # Compare result, too
-    ref_d_f = pd.read_csv("tests/3-packages.csv")
+    ref_d_f = three_pkg_ref_csv
     result_d_f = pd.read_csv(tmp_outfile + ".csv")
-    assert result_d_f.equals(ref_d_f)
+    assert_frame_equal(result_d_f, ref_d_f)
     # Also the Excel-version
     xl_result_d_f = pd.read_excel(
         tmp_outfile + ".xlsx", sheet_name=_DATA_SHEET_NAME, engine="openpyxl"
     )
-    assert xl_result_d_f.equals(ref_d_f)
+    assert_frame_equal(xl_result_d_f, ref_d_f)
 
 
 # No empty lines at the end eg. broken package